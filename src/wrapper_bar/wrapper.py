@@ -28,18 +28,27 @@ from io import TextIOWrapper
 from os import getcwd as pwd
 from os.path import join as jPath, abspath, isdir
 from pathlib import PurePosixPath
-from time import sleep
+from time import sleep, monotonic
 from datetime import datetime
 from types import CodeType
+import functools
 import requests.adapters
 from tqdm import tqdm
 import progressbar
+import queue
+import shlex
 import subprocess
 import sys
+import threading
 import requests
 
 from .Exceptions import *
 
+@functools.lru_cache(maxsize=256)
+def _compile_one(src:str) -> CodeType:
+    """Compile one exec-mode snippet, memoised by source text."""
+    return compile(src, '<string>', 'exec')
+
 class Wrapper:
     """Wrapper Class: Wrap commands/scripts across a progress bar.
     
@@ -98,85 +107,146 @@ class Wrapper:
     Feel free to check out the code and do any modifications you like under the
     MIT License. ;)
     """
+    _TIMER_WIDGETS = {'ETA': progressbar.AdaptiveETA, 'ElapsedTime': progressbar.Timer}
+
     def __init__(self, marker:str = "▓") -> None:
         """Initialize the Wrapper class"""
         self.marker = marker
-    
-    def decoy(self, label:str = "", delay: float = 0.1, width:float = 50, timer: str = 'ETA'):
+        self.pyShellWrapperResults:dict = {}
+
+    def _build_widgets(self, label:str, timer:str) -> list:
+        """Build the widget list for a progressbar from `label` and `timer`."""
+        return [label+" ", progressbar.Bar(marker=self.marker), self._TIMER_WIDGETS.get(timer, progressbar.AdaptiveETA)()]
+
+    def _log_worker(self, log_q:queue.Queue, logfile:TextIOWrapper):
+        """Drain log records from `log_q` into `logfile` until a None sentinel arrives."""
+        while True:
+            record = log_q.get()
+            if record is None:
+                log_q.task_done()
+                break
+            logfile.writelines(record)
+            logfile.flush()
+            log_q.task_done()
+
+    def decoy(self, label:str = "", delay: float = 0.1, width:float = 50, timer: str = 'ETA', min_refresh_hz:float = 30):
         """Create a decoy progress bar, that does nothing at all.
-        
+
         `steps`:
         >>> wrapControl = Wrapper()
         >>> wrapControl.decoy()
+
+        `min_refresh_hz` parameter:
+        default: 30
+        Caps how often the bar is redrawn. Ticks that arrive faster than this
+        rate are coalesced instead of overdrawing the terminal.
         """
-        if timer=='ETA':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
-        elif timer=='ElapsedTime':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.Timer()]
-        else:
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
-            
+        widgets = self._build_widgets(label, timer)
+
         try:
             bar = progressbar.ProgressBar(widgets=widgets, maxval=100, term_width=width).start()
-            
+
+            min_interval = 1/min_refresh_hz
+            last = 0.0
+
             for i in range(100):
                 sleep(delay)
-                bar.update(i)
-            
+                now = monotonic()
+                if now - last > min_interval or i == 99:
+                    bar.update(i)
+                    last = now
+
             bar.finish()
         except KeyboardInterrupt:
             pass
     
     def shellWrapper(self, shellcommands: list[str], label:str = "", delay: float = 0.1, width:float = 50, timer: str = 'ETA',
-                     logger:bool = False, logfile:TextIOWrapper = None, logfile_auto_close:bool = False):
+                     logger:bool = False, logfile:TextIOWrapper = None, logfile_auto_close:bool = False, parallel:int = 1):
         """Wrap shell commands with the progressbar.
-        
+
         `steps`:
         >>> wrapControl.shellWrapper(shellcommands:list[str], label:str = '' (optional),
                                     delay:float (optional),
                                     width:float (optional), timer:str (optional),
                                     logger:bool (optional), logfile:TextIOWrapper (optional),
-                                    logfile_auto_close:bool (optional))
+                                    logfile_auto_close:bool (optional),
+                                    parallel:int (optional))
 
         `timer` parameter:
         default: 'ETA'
         possible values: ['ETA', 'ElapsedTime']
+
+        `delay` parameter is kept for backward compatibility. The bar now advances
+        as each command actually finishes, so no artificial delay is added.
+
+        `parallel` parameter:
+        default: 1 (commands run one after another)
+        If set to more than 1, at most that many commands run at once and the bar
+        advances as each one completes. Only use this for independent commands.
         """
         if logger:
             if not logfile:
-                logfile = open(jPath(pwd(), '.log'), 'w')
-        
-        if timer=='ETA':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
-        elif timer=='ElapsedTime':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.Timer()]
+                logfile = open(jPath(pwd(), '.log'), 'w', buffering=1<<16)
+            sink = logfile
+            log_q = queue.Queue(maxsize=256)
+            log_thread = threading.Thread(target=self._log_worker, args=(log_q, logfile), daemon=True)
+            log_thread.start()
+            t0 = monotonic()
+            log_q.put([f"=== run started {datetime.now():%Y-%m-%d %H:%M:%S} ===\n"])
         else:
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
+            sink = subprocess.DEVNULL
+        
+        widgets = self._build_widgets(label, timer)
         
         try:
-            bar = progressbar.ProgressBar(widgets=widgets, term_width=width, maxval=100).start()
-            
-            interval = int(100/(len(shellcommands)+1))
-            iterator = 0
-            
-            for i in range(100):
-                if i>=interval and (i==interval or i%interval==0) and iterator<len(shellcommands):
-                    logfile.write(f"{datetime.today().strftime('%B %d, %Y')} {datetime.now().strftime('%H hours %M minutes %S seconds')}\n")
-                    logfile.write(f"Command Executed: \'{shellcommands[iterator]}\'\n")
-                    subprocess.Popen(shellcommands[iterator].split(' '), stderr=logfile, stdout=logfile).wait()
-                    logfile.write(f'\nEND\n')
-                    iterator += 1
-                    bar.update(i)
-                else:
-                    sleep(delay)
-                    bar.update(i)
-            
+            total = len(shellcommands)
+            bar = progressbar.ProgressBar(widgets=widgets, term_width=width, maxval=total).start()
+
+            tokenized = [shlex.split(command) for command in shellcommands]
+
+            if parallel > 1:
+                running:dict[int, subprocess.Popen] = {}
+                launched = 0
+                done = 0
+
+                while done < total:
+                    while launched < total and len(running) < parallel:
+                        if logger:
+                            log_q.put([f"[+{monotonic()-t0:7.3f}s] Command Executed: \'{shellcommands[launched]}\'\n"])
+                            log_q.join()
+                        running[launched] = subprocess.Popen(tokenized[launched], stderr=sink, stdout=sink)
+                        launched += 1
+
+                    for index in list(running):
+                        if running[index].poll() is not None:
+                            del running[index]
+                            if logger:
+                                log_q.put([f"\nEND \'{shellcommands[index]}\'\n"])
+                            done += 1
+                            bar.update(done)
+
+                    if running:
+                        sleep(0.05)
+            else:
+                for iterator in range(total):
+                    if logger:
+                        log_q.put([f"[+{monotonic()-t0:7.3f}s] Command Executed: \'{shellcommands[iterator]}\'\n"])
+                        log_q.join()
+                    subprocess.run(tokenized[iterator], stderr=sink, stdout=sink, check=False)
+                    if logger:
+                        log_q.put([f'\nEND\n'])
+                    bar.update(iterator+1)
+
             bar.finish()
         except KeyboardInterrupt:
             pass
-        
-        if logfile_auto_close:
-            logfile.close()
+        finally:
+            if logger:
+                log_q.put(None)
+                log_thread.join()
+
+            if logfile_auto_close and logfile:
+                logfile.close()
     
     def pyWrapper(self, pythonscripts: list[str], label:str = "", delay: float = 0.1, width: float = 50, timer:str = 'ETA',
                   logger:bool = False, logfile: TextIOWrapper = None, logfile_auto_close:bool = False):
@@ -188,59 +258,60 @@ class Wrapper:
                                 width:float (optional), timer:str (optional),
                                 logger:bool (optional), logfile:TextIOWrapper (optional),
                                 logfile_auto_close:bool (optional))
-        
+
         `timer` parameter:
         default: 'ETA'
         possible values: ['ETA', 'ElapsedTime']
+
+        `delay` parameter is kept for backward compatibility. The bar now advances
+        as each script actually finishes, so no artificial delay is added.
         """
         if logger:
             if not logfile:
-                logfile = open(jPath(pwd(), '.log'), 'w')
+                logfile = open(jPath(pwd(), '.log'), 'w', buffering=1<<16)
+            sink = logfile
+            log_q = queue.Queue(maxsize=256)
+            log_thread = threading.Thread(target=self._log_worker, args=(log_q, logfile), daemon=True)
+            log_thread.start()
+            t0 = monotonic()
+            log_q.put([f"=== run started {datetime.now():%Y-%m-%d %H:%M:%S} ===\n"])
+        else:
+            sink = subprocess.DEVNULL
         
-        for i in range(len(pythonscripts)):
-            pythonscripts[i] = abspath(pythonscripts[i])
+        pythonscripts = [abspath(script) for script in pythonscripts]
         
-        if timer=='ETA':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
-        elif timer=='ElapsedTime':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.Timer()]
-        else:
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
+        widgets = self._build_widgets(label, timer)
         
         try:
-            bar = progressbar.ProgressBar(widgets=widgets, maxval=100, term_width=width).start()
-            
-            interval = int(100/(len(pythonscripts)+1))
-            iterator = 0
-            
-            for i in range(100):
-                if i>=interval and (i==interval or i%interval==0) and iterator<len(pythonscripts):
-                    logfile.write(f"{datetime.today().strftime('%B %d, %Y')} {datetime.now().strftime('%H hours %M minutes %S seconds')}\n")
-                    logfile.write(f"Python File Executed: \'{pythonscripts[iterator]}\'\n")
-                    subprocess.Popen(['python'].extend(pythonscripts[iterator].split(' ')), stderr=logfile).wait()
-                    logfile.write(f"\nEND\n")
-                    iterator += 1
-                    bar.update(i)
-                else:
-                    sleep(delay)
-                    bar.update(i)
-            
+            total = len(pythonscripts)
+            bar = progressbar.ProgressBar(widgets=widgets, maxval=total, term_width=width).start()
+
+            tokenized = [[sys.executable, *shlex.split(script)] for script in pythonscripts]
+
+            for iterator in range(total):
+                if logger:
+                    log_q.put([f"[+{monotonic()-t0:7.3f}s] Python File Executed: \'{pythonscripts[iterator]}\'\n"])
+                    log_q.join()
+                subprocess.run(tokenized[iterator], stderr=sink, stdout=sink, check=False)
+                if logger:
+                    log_q.put([f"\nEND\n"])
+                bar.update(iterator+1)
+
             bar.finish()
         except KeyboardInterrupt:
             pass
-        
-        if logfile_auto_close:
-            logfile.close()
+        finally:
+            if logger:
+                log_q.put(None)
+                log_thread.join()
+
+            if logfile_auto_close and logfile:
+                logfile.close()
     
     def __compile(self, codes:list[str]) -> list[CodeType]:
-        compiledcodes:list[CodeType] = []
-        for code in codes:
-            compiledcode = compile(code, '<string>', 'exec')
-            compiledcodes.append(compiledcode)
-        
-        return compiledcodes
+        return [_compile_one(code) for code in codes]
     
-    def pyShellWrapper(self, pythoncodes: list[str], dependencies:list[str] = [], label:str = "", delay:float = 0.1, width:float = 50,
+    def pyShellWrapper(self, pythoncodes: list[str], dependencies:list[str] | None = None, label:str = "", delay:float = 0.1, width:float = 50,
                        timer:str = 'ETA'):
         """Wrap inline python codes with a progressbar
         
@@ -258,55 +329,40 @@ class Wrapper:
         pythoncodes -> list of python codes
         dependencies -> list of dependencies. Suppose 'a = b+c' is among the python codes list.
                         Therefore, b and c's value are dependencies and depencies=['b=10', 'c=115'].
+
+        `delay` parameter is kept for backward compatibility. The bar now advances
+        as each code actually finishes executing, so no artificial delay is added.
         """
         
-        codes = []
-        self.__pyshellresults = {}
-        
-        variables=""""""
-        for c in dependencies:
-            variables += c + "\n"
-        
-        for x in pythoncodes:
-            code = variables + x + "\n"
-            codes.append(code)
-        
+        self.pyShellWrapperResults.clear()
+        self.pyShellWrapperResults['__builtins__'] = __builtins__
+
+        prologue = "\n".join(dependencies) if dependencies else ""
+
         try:
-            compiledcodes = self.__compile(codes=codes)
-        except KeyboardInterrupt:
-            sys.exit(1)
+            if prologue:
+                exec(self.__compile(codes=[prologue])[0], self.pyShellWrapperResults)
+            compiledcodes = self.__compile(codes=pythoncodes)
+        except SyntaxError as e:
+            raise WrapperCodeDefinitionError(str(e)) from e
 
-        
-        if timer=='ETA':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
-        elif timer=='ElapsedTime':
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.Timer()]
-        else:
-            widgets = [label+" ", progressbar.Bar(marker=self.marker), progressbar.AdaptiveETA()]
+
+        widgets = self._build_widgets(label, timer)
         
         try:
-            bar = progressbar.ProgressBar(widgets=widgets, maxval=100, term_width=width).start()
-            
-            interval = int(100/(len(pythoncodes)+1))
-            iterator = 0
-            
-            for i in range(100):
-                if i>=interval and (i==interval or i%interval==0) and iterator<len(pythoncodes):
-                    exec(compiledcodes[iterator], globals(), self.__pyshellresults)
-                    iterator += 1
-                    bar.update(i)
-                else:
-                    sleep(delay)
-                    bar.update(i)
-            
+            total = len(pythoncodes)
+            bar = progressbar.ProgressBar(widgets=widgets, maxval=total, term_width=width).start()
+
+            for iterator in range(total):
+                exec(compiledcodes[iterator], self.pyShellWrapperResults)
+                bar.update(iterator+1)
+
             bar.finish()
         except KeyboardInterrupt:
             pass
-    
-    def __fetchPyShellWrapperResults(self):
-        return self.__pyshellresults
-    
-    pyShellWrapperResults = property(fget=__fetchPyShellWrapperResults)
+        finally:
+            self.pyShellWrapperResults.pop('__builtins__', None)
+
 
     def downloadWrapper(self, link: str, download_to: str, download_filename: str | None = None, type: str = 'direct', github_release: str = 'latest', private_repo: bool = False, github_api_token: str | None = None, label: str | None = None, width: int = 70, chunk_size: int = 1024):
         """